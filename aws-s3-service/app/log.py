@@ -0,0 +1,28 @@
+"""Logging setup shared by the web app and the standalone SQS worker."""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+
+_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """Route the root logger through a queue drained by a background thread.
+
+    Callers on the event loop only enqueue records; formatting and writing to
+    stderr happen on the QueueListener thread, so a slow or blocked stdout pipe
+    cannot stall request handling or the SQS consumer.
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(_FORMAT))
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    # The queue side only merges args (and any traceback) into the message;
+    # the listener's handler applies the real format.
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=level, handlers=[queue_handler])
+    listener.start()
+    atexit.register(listener.stop)
@@ -1,18 +1,17 @@
 import asyncio
-import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
+from app.config import settings
+from app.log import configure_logging
 from app.routers import health, s3, sns
 from app.routers import users
-from app.services import db_service
+from app.services import db_service, s3_service, sns_service, sqs_service
 from app.services.sqs_service import poll_sqs
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
-)
+configure_logging()
 
 
 @asynccontextmanager
@@ -20,20 +19,29 @@ async def lifespan(app: FastAPI):
     # Initialise PostgreSQL connection pool
     await db_service.init_pool()
 
-    # Start SQS consumer background task
+    # Build the long-lived AWS clients once, before serving requests
+    await s3_service.init_client()
+    await sns_service.init_client()
+    await sqs_service.init_client()
+
+    # Start SQS consumer background task (unless a dedicated worker runs it)
     stop_event = asyncio.Event()
-    sqs_task = asyncio.create_task(poll_sqs(stop_event))
+    sqs_task = asyncio.create_task(poll_sqs(stop_event)) if settings.run_sqs_poller else None
 
     yield
 
     # Shutdown
-    stop_event.set()
-    sqs_task.cancel()
-    try:
-        await sqs_task
-    except asyncio.CancelledError:
-        pass
-
+    if sqs_task is not None:
+        stop_event.set()
+        sqs_task.cancel()
+        try:
+            await sqs_task
+        except asyncio.CancelledError:
+            pass
+
+    await sqs_service.close_client()
+    await sns_service.close_client()
+    await s3_service.close_client()
     await db_service.close_pool()
 
 
@@ -42,6 +50,7 @@ app = FastAPI(
     description="REST API for S3 file operations, user data (PostgreSQL), SNS notifications, and SQS",
     version="2.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(health.router)
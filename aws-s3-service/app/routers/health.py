@@ -1,10 +1,14 @@
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from app.schemas.models import MessageResponse
 
 router = APIRouter(tags=["health"])
 
+_OK = {"message": "ok"}
+
 
 @router.get("/health", response_model=MessageResponse)
 async def health_check():
-    return MessageResponse(message="ok")
+    # Returning a Response skips response_model validation on this hot probe path
+    return ORJSONResponse(_OK)
@@ -10,7 +10,7 @@ router = APIRouter(prefix="/s3", tags=["s3"])
 async def read_file(key: str):
     """Read a JSON file from S3."""
     try:
-        content = s3_service.read_json_file(key)
+        content = await s3_service.read_json_file(key)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File not found: {key}")
     return S3FileResponse(key=key, content=content)
@@ -20,11 +20,13 @@ async def read_file(key: str):
 async def update_file(key: str, body: S3UpdateRequest):
     """Update (merge) a JSON file in S3 and notify via SNS."""
     try:
-        updated = s3_service.update_json_file(key, body.content)
+        updated = await s3_service.update_json_file(key, body.content)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File not found: {key}")
+    except s3_service.UpdateConflictError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
 
-    sns_service.publish_message(
+    await sns_service.publish_message(
         message=f"S3 file updated: {key}",
         subject="S3 File Update",
     )
@@ -34,8 +36,8 @@ async def update_file(key: str, body: S3UpdateRequest):
 @router.post("/upload", response_model=MessageResponse)
 async def upload_file(body: S3UploadRequest):
     """Upload a new JSON file to S3 and notify via SNS."""
-    s3_service.upload_json_file(body.key, body.content)
-    sns_service.publish_message(
+    await s3_service.upload_json_file(body.key, body.content)
+    await sns_service.publish_message(
         message=f"S3 file uploaded: {body.key}",
         subject="S3 File Upload",
     )
@@ -9,7 +9,7 @@ router = APIRouter(prefix="/sns", tags=["sns"])
 @router.post("/publish", response_model=SNSPublishResponse)
 async def publish(body: SNSPublishRequest):
     """Publish a custom message to the configured SNS topic."""
-    message_id = sns_service.publish_message(
+    message_id = await sns_service.publish_message(
         message=body.message,
         subject=body.subject,
     )
@@ -8,21 +8,28 @@ Endpoints cover:
 
 import asyncio
 import logging
-from datetime import date, datetime
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Body, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from app.schemas.models import (
+    BatchInsertResponse,
+    FinancialInfoBase,
     FinancialInfoCreate,
     FinancialInfoRecord,
     FinancialInfoUpdate,
+    HealthInfoBase,
     HealthInfoCreate,
     HealthInfoRecord,
     HealthInfoUpdate,
     MessageResponse,
+    PersonalInfoBase,
     PersonalInfoCreate,
     PersonalInfoRecord,
     PersonalInfoUpdate,
+    SQSBatchFailure,
+    SQSBatchSendResponse,
     SQSSendRequest,
     SQSSendResponse,
     UserFullRecord,
@@ -32,6 +39,20 @@ from app.services import db_service, s3_service, sqs_service
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/users", tags=["users"])
 
+# 404 detail per SQS data_type; also the set of accepted data_type values
+_SQS_NOT_FOUND = {
+    "personal": "Personal info not found for user {user_id}",
+    "financial": "Financial info not found for user {user_id}",
+    "health": "Health info not found for user {user_id}",
+    "all": "No records found for user {user_id}",
+}
+
+# SendMessageBatch accepts at most 10 entries totalling 256 KiB per call; a
+# send_batch request is capped so it never starts more than 10 calls at once.
+_SQS_BATCH_SIZE = 10
+_SQS_BATCH_MAX_BYTES = 256 * 1024
+_SQS_MAX_BATCH_REQUESTS = 100
+
 
 # ---------------------------------------------------------------------------
 # S3 — read user data files
@@ -41,7 +62,7 @@ router = APIRouter(prefix="/users", tags=["users"])
 async def read_personal_from_s3(user_id: str) -> dict:
     """Read personal information JSON from S3."""
     try:
-        return s3_service.read_personal_info(user_id)
+        return await s3_service.read_personal_info(user_id)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"Personal info not found in S3 for user {user_id}")
 
@@ -50,7 +71,7 @@ async def read_personal_from_s3(user_id: str) -> dict:
 async def read_financial_from_s3(user_id: str) -> dict:
     """Read financial information JSON from S3."""
     try:
-        return s3_service.read_financial_info(user_id)
+        return await s3_service.read_financial_info(user_id)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"Financial info not found in S3 for user {user_id}")
 
@@ -59,7 +80,7 @@ async def read_financial_from_s3(user_id: str) -> dict:
 async def read_health_from_s3(user_id: str) -> dict:
     """Read health information JSON from S3."""
     try:
-        return s3_service.read_health_info(user_id)
+        return await s3_service.read_health_info(user_id)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"Health info not found in S3 for user {user_id}")
 
@@ -68,7 +89,7 @@ async def read_health_from_s3(user_id: str) -> dict:
 async def read_all_from_s3(user_id: str) -> dict:
     """Read and merge personal, financial, and health information from S3."""
     try:
-        return s3_service.read_all_user_info(user_id)
+        return await s3_service.read_all_user_info(user_id)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc))
 
@@ -81,13 +102,24 @@ async def read_all_from_s3(user_id: str) -> dict:
 async def create_personal(body: PersonalInfoCreate):
     """Insert personal information into the database."""
     try:
-        record = await db_service.insert_personal(body.model_dump())
+        record = await db_service.insert_personal(body)
     except Exception as exc:
         logger.exception("Failed to insert personal info for user %s", body.user_id)
         raise HTTPException(status_code=409, detail=str(exc))
     return record
 
 
+@router.post("/personal/batch", response_model=BatchInsertResponse, status_code=201)
+async def create_personal_batch(body: list[PersonalInfoCreate]):
+    """Insert many personal-info rows in one round-trip; all or none are inserted."""
+    try:
+        inserted = await db_service.insert_personal_many(body)
+    except Exception as exc:
+        logger.exception("Failed to batch-insert personal info for %d users", len(body))
+        raise HTTPException(status_code=409, detail=str(exc))
+    return BatchInsertResponse(inserted=inserted)
+
+
 @router.get("/{user_id}/personal", response_model=PersonalInfoRecord)
 async def get_personal(user_id: str):
     """Fetch personal information from the database."""
@@ -100,19 +132,25 @@ async def get_personal(user_id: str):
 @router.patch("/{user_id}/personal", response_model=PersonalInfoRecord)
 async def update_personal(user_id: str, body: PersonalInfoUpdate):
     """Update personal information in the database."""
-    record = await db_service.update_personal(user_id, body.model_dump(exclude_none=True))
+    record = await db_service.update_personal(user_id, body)
     if record is None:
         raise HTTPException(status_code=404, detail=f"Personal info not found for user {user_id}")
     return record
 
 
+@router.put("/{user_id}/personal", response_model=PersonalInfoRecord)
+async def upsert_personal(user_id: str, body: PersonalInfoBase):
+    """Create or fully replace personal information in the database."""
+    return await db_service.upsert_personal(user_id, body)
+
+
 @router.delete("/{user_id}/personal", response_model=MessageResponse)
 async def delete_personal(user_id: str):
     """Delete personal information from the database."""
     deleted = await db_service.delete_personal(user_id)
     if not deleted:
         raise HTTPException(status_code=404, detail=f"Personal info not found for user {user_id}")
-    return MessageResponse(message=f"Personal info deleted for user {user_id}")
+    return ORJSONResponse({"message": f"Personal info deleted for user {user_id}"})
 
 
 # ---------------------------------------------------------------------------
@@ -123,13 +161,24 @@ async def delete_personal(user_id: str):
 async def create_financial(body: FinancialInfoCreate):
     """Insert financial information into the database."""
     try:
-        record = await db_service.insert_financial(body.model_dump())
+        record = await db_service.insert_financial(body)
     except Exception as exc:
         logger.exception("Failed to insert financial info for user %s", body.user_id)
         raise HTTPException(status_code=409, detail=str(exc))
     return record
 
 
+@router.post("/financial/batch", response_model=BatchInsertResponse, status_code=201)
+async def create_financial_batch(body: list[FinancialInfoCreate]):
+    """Insert many financial-info rows in one round-trip; all or none are inserted."""
+    try:
+        inserted = await db_service.insert_financial_many(body)
+    except Exception as exc:
+        logger.exception("Failed to batch-insert financial info for %d users", len(body))
+        raise HTTPException(status_code=409, detail=str(exc))
+    return BatchInsertResponse(inserted=inserted)
+
+
 @router.get("/{user_id}/financial", response_model=FinancialInfoRecord)
 async def get_financial(user_id: str):
     """Fetch financial information from the database."""
@@ -142,19 +191,25 @@ async def get_financial(user_id: str):
 @router.patch("/{user_id}/financial", response_model=FinancialInfoRecord)
 async def update_financial(user_id: str, body: FinancialInfoUpdate):
     """Update financial information in the database."""
-    record = await db_service.update_financial(user_id, body.model_dump(exclude_none=True))
+    record = await db_service.update_financial(user_id, body)
     if record is None:
         raise HTTPException(status_code=404, detail=f"Financial info not found for user {user_id}")
     return record
 
 
+@router.put("/{user_id}/financial", response_model=FinancialInfoRecord)
+async def upsert_financial(user_id: str, body: FinancialInfoBase):
+    """Create or fully replace financial information in the database."""
+    return await db_service.upsert_financial(user_id, body)
+
+
 @router.delete("/{user_id}/financial", response_model=MessageResponse)
 async def delete_financial(user_id: str):
     """Delete financial information from the database."""
     deleted = await db_service.delete_financial(user_id)
     if not deleted:
         raise HTTPException(status_code=404, detail=f"Financial info not found for user {user_id}")
-    return MessageResponse(message=f"Financial info deleted for user {user_id}")
+    return ORJSONResponse({"message": f"Financial info deleted for user {user_id}"})
 
 
 # ---------------------------------------------------------------------------
@@ -165,13 +220,24 @@ async def delete_financial(user_id: str):
 async def create_health(body: HealthInfoCreate):
     """Insert health information into the database."""
     try:
-        record = await db_service.insert_health(body.model_dump())
+        record = await db_service.insert_health(body)
     except Exception as exc:
         logger.exception("Failed to insert health info for user %s", body.user_id)
         raise HTTPException(status_code=409, detail=str(exc))
     return record
 
 
+@router.post("/health/batch", response_model=BatchInsertResponse, status_code=201)
+async def create_health_batch(body: list[HealthInfoCreate]):
+    """Insert many health-info rows in one round-trip; all or none are inserted."""
+    try:
+        inserted = await db_service.insert_health_many(body)
+    except Exception as exc:
+        logger.exception("Failed to batch-insert health info for %d users", len(body))
+        raise HTTPException(status_code=409, detail=str(exc))
+    return BatchInsertResponse(inserted=inserted)
+
+
 @router.get("/{user_id}/health", response_model=HealthInfoRecord)
 async def get_health(user_id: str):
     """Fetch health information from the database."""
@@ -184,19 +250,25 @@ async def get_health(user_id: str):
 @router.patch("/{user_id}/health", response_model=HealthInfoRecord)
 async def update_health(user_id: str, body: HealthInfoUpdate):
     """Update health information in the database."""
-    record = await db_service.update_health(user_id, body.model_dump(exclude_none=True))
+    record = await db_service.update_health(user_id, body)
     if record is None:
         raise HTTPException(status_code=404, detail=f"Health info not found for user {user_id}")
     return record
 
 
+@router.put("/{user_id}/health", response_model=HealthInfoRecord)
+async def upsert_health(user_id: str, body: HealthInfoBase):
+    """Create or fully replace health information in the database."""
+    return await db_service.upsert_health(user_id, body)
+
+
 @router.delete("/{user_id}/health", response_model=MessageResponse)
 async def delete_health(user_id: str):
     """Delete health information from the database."""
     deleted = await db_service.delete_health(user_id)
     if not deleted:
         raise HTTPException(status_code=404, detail=f"Health info not found for user {user_id}")
-    return MessageResponse(message=f"Health info deleted for user {user_id}")
+    return ORJSONResponse({"message": f"Health info deleted for user {user_id}"})
 
 
 # ---------------------------------------------------------------------------
@@ -229,41 +301,18 @@ async def send_user_data_to_sqs(body: SQSSendRequest):
     user_id = body.user_id
     data_type = body.data_type
 
-    if data_type == "personal":
-        record = await db_service.get_personal(user_id)
-        if record is None:
-            raise HTTPException(status_code=404, detail=f"Personal info not found for user {user_id}")
-        payload = {"user_id": user_id, "data_type": "personal", "data": record}
-
-    elif data_type == "financial":
-        record = await db_service.get_financial(user_id)
-        if record is None:
-            raise HTTPException(status_code=404, detail=f"Financial info not found for user {user_id}")
-        payload = {"user_id": user_id, "data_type": "financial", "data": record}
-
-    elif data_type == "health":
-        record = await db_service.get_health(user_id)
-        if record is None:
-            raise HTTPException(status_code=404, detail=f"Health info not found for user {user_id}")
-        payload = {"user_id": user_id, "data_type": "health", "data": record}
-
-    elif data_type == "all":
-        full = await db_service.get_user_full(user_id)
-        if not any([full["personal"], full["financial"], full["health"]]):
-            raise HTTPException(status_code=404, detail=f"No records found for user {user_id}")
-        payload = {"user_id": user_id, "data_type": "all", "data": full}
-
-    else:
+    if data_type not in _SQS_NOT_FOUND:
         raise HTTPException(
             status_code=422,
             detail=f"Invalid data_type '{data_type}'. Must be one of: personal, financial, health, all",
         )
 
-    # asyncpg returns datetime/date objects — convert to strings for JSON serialisation
-    payload = _serialisable(payload)
+    # The message body is serialised by PostgreSQL; no Python-side conversion needed
+    payload = await db_service.get_user_json(user_id, data_type)
+    if payload is None:
+        raise HTTPException(status_code=404, detail=_SQS_NOT_FOUND[data_type].format(user_id=user_id))
 
-    message_id = await asyncio.to_thread(
-        sqs_service.send_message,
+    message_id = await sqs_service.send_message(
         payload,
         message_group_id=body.message_group_id,
         message_deduplication_id=body.message_deduplication_id,
@@ -272,16 +321,91 @@ async def send_user_data_to_sqs(body: SQSSendRequest):
     return SQSSendResponse(message_id=message_id, user_id=user_id, data_type=data_type)
 
 
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
+def _sqs_chunks(messages: list[dict]) -> list[tuple[int, int]]:
+    """Split messages into [start, end) ranges that each fit one SendMessageBatch call."""
+    chunks: list[tuple[int, int]] = []
+    start, size = 0, 0
+    for i, message in enumerate(messages):
+        body_size = len(message["body"].encode())
+        if i > start and (i - start == _SQS_BATCH_SIZE or size + body_size > _SQS_BATCH_MAX_BYTES):
+            chunks.append((start, i))
+            start, size = i, 0
+        size += body_size
+    if start < len(messages):
+        chunks.append((start, len(messages)))
+    return chunks
+
+
+@router.post("/sqs/send_batch", response_model=SQSBatchSendResponse)
+async def send_users_data_to_sqs(
+    body: Annotated[list[SQSSendRequest], Body(max_length=_SQS_MAX_BATCH_REQUESTS)],
+):
+    """Fetch data for several users and send it to SQS in batches.
+
+    Each item behaves like a POST /users/sqs/send request; at most 100 items
+    are accepted per request. All records are fetched in one query and sent
+    with SendMessageBatch (up to 10 messages and 256 KiB per call, calls run
+    concurrently). Users without matching records, entries SQS rejects and
+    entries of a SendMessageBatch call that errors are reported under "failed"
+    instead of failing the whole request.
+    """
+    for item in body:
+        if item.data_type not in _SQS_NOT_FOUND:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Invalid data_type '{item.data_type}'. Must be one of: personal, financial, health, all",
+            )
+
+    payloads = await db_service.get_users_json(
+        [item.user_id for item in body],
+        [item.data_type for item in body],
+    )
+
+    failed: list[SQSBatchFailure] = []
+    pending: list[SQSSendRequest] = []
+    messages: list[dict] = []
+    for item, payload in zip(body, payloads):
+        if payload is None:
+            failed.append(SQSBatchFailure(
+                user_id=item.user_id,
+                data_type=item.data_type,
+                detail=_SQS_NOT_FOUND[item.data_type].format(user_id=item.user_id),
+            ))
+            continue
+        pending.append(item)
+        messages.append({
+            "body": payload,
+            "message_group_id": item.message_group_id,
+            "message_deduplication_id": item.message_deduplication_id,
+        })
+
+    # A chunk whose SendMessageBatch call raises only fails its own items; the
+    # other chunks have been sent and are still reported as sent.
+    ranges = _sqs_chunks(messages)
+    chunks = await asyncio.gather(
+        *(sqs_service.send_message_batch(messages[start:end]) for start, end in ranges),
+        return_exceptions=True,
+    )
 
-def _serialisable(obj):
-    """Recursively convert non-JSON-serialisable types (date, datetime) to strings."""
-    if isinstance(obj, dict):
-        return {k: _serialisable(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_serialisable(v) for v in obj]
-    if isinstance(obj, (datetime, date)):
-        return obj.isoformat()
-    return obj
+    sent: list[SQSSendResponse] = []
+    for (start, end), chunk in zip(ranges, chunks):
+        items = pending[start:end]
+        if isinstance(chunk, Exception):
+            logger.error("SQS batch send of %d messages failed", len(items), exc_info=chunk)
+            failed.extend(
+                SQSBatchFailure(user_id=item.user_id, data_type=item.data_type, detail=f"SQS send failed: {chunk}")
+                for item in items
+            )
+            continue
+        for item, message_id in zip(items, chunk):
+            if message_id is None:
+                failed.append(SQSBatchFailure(
+                    user_id=item.user_id,
+                    data_type=item.data_type,
+                    detail="Rejected by SQS",
+                ))
+            else:
+                sent.append(SQSSendResponse(message_id=message_id, user_id=item.user_id, data_type=item.data_type))
+
+    logger.info("Sent %d of %d user records to SQS", len(sent), len(body))
+    return SQSBatchSendResponse(sent=sent, failed=failed)
@@ -35,8 +35,15 @@ class MessageResponse(BaseModel):
     message: str
 
 
+class BatchInsertResponse(BaseModel):
+    inserted: int
+
+
 # ---------------------------------------------------------------------------
 # User personal information
+# User data models are frozen (immutable once validated) and ignore unknown
+# keys, so DB rows can be validated without extra-field checks. Record models
+# inherit this config and add from_attributes.
 # ---------------------------------------------------------------------------
 
 class PersonalInfoBase(BaseModel):
@@ -46,6 +53,8 @@ class PersonalInfoBase(BaseModel):
     address: str | None = None
     date_of_birth: date | None = None
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
 
 class PersonalInfoCreate(PersonalInfoBase):
     user_id: str
@@ -58,6 +67,8 @@ class PersonalInfoUpdate(BaseModel):
     address: str | None = None
     date_of_birth: date | None = None
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
 
 class PersonalInfoRecord(PersonalInfoCreate):
     created_at: datetime | None = None
@@ -76,6 +87,8 @@ class FinancialInfoBase(BaseModel):
     annual_income: float | None = None
     total_debt: float | None = None
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
 
 class FinancialInfoCreate(FinancialInfoBase):
     user_id: str
@@ -102,6 +115,8 @@ class HealthInfoBase(BaseModel):
     medications: list[str] = []
     allergies: list[str] = []
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
 
 class HealthInfoCreate(HealthInfoBase):
     user_id: str
@@ -128,6 +143,8 @@ class UserFullRecord(BaseModel):
     financial: FinancialInfoRecord | None = None
     health: HealthInfoRecord | None = None
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
 
 # ---------------------------------------------------------------------------
 # SQS payload models
@@ -144,3 +161,21 @@ class SQSSendResponse(BaseModel):
     message_id: str
     user_id: str
     data_type: str
+
+
+class SQSBatchFailure(BaseModel):
+    user_id: str
+    data_type: str
+    detail: str
+
+
+class SQSBatchSendResponse(BaseModel):
+    sent: list[SQSSendResponse]
+    failed: list[SQSBatchFailure]
+
+
+class SQSUserMessage(BaseModel):
+    """Body of the messages published by POST /users/sqs/send."""
+    user_id: str
+    data_type: str
+    data: dict[str, Any]
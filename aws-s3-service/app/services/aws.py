@@ -0,0 +1,54 @@
+"""Long-lived aiobotocore clients shared by the S3, SNS and SQS services."""
+
+import logging
+
+import aioboto3
+from botocore.config import Config
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# One large keep-alive connection pool per client so concurrent requests do not
+# queue behind botocore's default of 10 connections.
+_CLIENT_CONFIG = Config(
+    max_pool_connections=100,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 3},
+)
+
+
+class AWSClient:
+    """Holder for one service's client, opened at startup and closed at shutdown.
+
+    The underlying aiobotocore client is entered once and reused, so every
+    request shares the same keep-alive HTTP connection pool.
+    """
+
+    def __init__(self, service_name: str):
+        self.service_name = service_name
+        self._client_cm = None
+        self._client = None
+
+    async def open(self) -> None:
+        """Open the client."""
+        kwargs = {"region_name": settings.aws_region, "config": _CLIENT_CONFIG}
+        if settings.aws_endpoint_url:
+            kwargs["endpoint_url"] = settings.aws_endpoint_url
+        self._client_cm = aioboto3.Session().client(self.service_name, **kwargs)
+        self._client = await self._client_cm.__aenter__()
+        logger.info("%s client initialised", self.service_name.upper())
+
+    async def close(self) -> None:
+        """Close the client if it is open."""
+        if self._client_cm:
+            await self._client_cm.__aexit__(None, None, None)
+            self._client_cm = None
+            self._client = None
+            logger.info("%s client closed", self.service_name.upper())
+
+    def get(self):
+        """Return the open client; raises RuntimeError before open()."""
+        if self._client is None:
+            raise RuntimeError(f"{self.service_name.upper()} client is not initialised")
+        return self._client
@@ -10,20 +10,31 @@ Each table uses user_id (TEXT) as the primary key.
 
 import asyncio
 import logging
+import weakref
 from typing import Any
 
 import asyncpg
+import orjson
+from asyncpg.prepared_stmt import PreparedStatement
+from cachetools import TTLCache
 
 from app.config import settings
+from app.schemas.models import (
+    FinancialInfoBase,
+    FinancialInfoCreate,
+    FinancialInfoUpdate,
+    HealthInfoBase,
+    HealthInfoCreate,
+    HealthInfoUpdate,
+    PersonalInfoBase,
+    PersonalInfoCreate,
+    PersonalInfoUpdate,
+)
 
 logger = logging.getLogger(__name__)
 
 _pool: asyncpg.Pool | None = None
 
-# ---------------------------------------------------------------------------
-# Pool lifecycle (called from main.py lifespan)
-# ---------------------------------------------------------------------------
-
 _DDL = """
 CREATE TABLE IF NOT EXISTS users_personal (
     user_id        TEXT PRIMARY KEY,
@@ -57,13 +68,276 @@ CREATE TABLE IF NOT EXISTS users_health (
 );
 """
 
+# Free space left in each heap page so updates (which never change the indexed
+# user_id) stay HOT: the new row version lands on the same page and the
+# primary-key index is not touched. Applied by _ensure_fillfactor only to
+# tables that lack it, so restarts do not rewrite pg_class or take locks.
+_FILLFACTOR = 90
+_FILLFACTOR_TABLES = ["users_personal", "users_financial", "users_health"]
+_FILLFACTOR_LOCK_TIMEOUT = "2s"
+
+_SQL_TABLES_WITHOUT_FILLFACTOR = f"""
+SELECT relname
+FROM pg_class
+WHERE oid = ANY($1::text[]::regclass[])
+  AND NOT coalesce(reloptions @> ARRAY['fillfactor={_FILLFACTOR}'], false)
+"""
+
+
+# ---------------------------------------------------------------------------
+# SQL statements
+# Kept as module-level constants so every call sends byte-identical text and
+# hits asyncpg's per-connection statement cache.
+# UPDATEs are fixed-shape: omitted fields bind NULL and COALESCE keeps the
+# stored value, so every partial update reuses the same plan.
+# DELETEs return a row per deleted record, so "was anything deleted" is a
+# plain value rather than a parsed command tag.
+# Columns are listed explicitly: exactly the fields of the *Record models,
+# timestamps included since the API returns them.
+# ---------------------------------------------------------------------------
+
+_PERSONAL_COLS = "user_id, name, email, phone, address, date_of_birth, created_at, updated_at"
+_FINANCIAL_COLS = "user_id, account_number, credit_score, annual_income, total_debt, created_at, updated_at"
+_HEALTH_COLS = "user_id, blood_type, conditions, medications, allergies, created_at, updated_at"
+
+_SQL_INSERT_PERSONAL = f"""
+INSERT INTO users_personal (user_id, name, email, phone, address, date_of_birth)
+VALUES ($1, $2, $3, $4, $5, $6)
+RETURNING {_PERSONAL_COLS}
+"""
+
+_SQL_GET_PERSONAL = f"SELECT {_PERSONAL_COLS} FROM users_personal WHERE user_id = $1"
+
+_SQL_UPDATE_PERSONAL = f"""
+UPDATE users_personal
+SET
+    name          = COALESCE($2, name),
+    email         = COALESCE($3, email),
+    phone         = COALESCE($4, phone),
+    address       = COALESCE($5, address),
+    date_of_birth = COALESCE($6, date_of_birth),
+    updated_at    = NOW()
+WHERE user_id = $1
+RETURNING {_PERSONAL_COLS}
+"""
+
+_SQL_DELETE_PERSONAL = "DELETE FROM users_personal WHERE user_id = $1 RETURNING TRUE"
+
+# Insert-or-replace in one statement; created_at survives a replace
+_SQL_UPSERT_PERSONAL = f"""
+INSERT INTO users_personal (user_id, name, email, phone, address, date_of_birth)
+VALUES ($1, $2, $3, $4, $5, $6)
+ON CONFLICT (user_id) DO UPDATE SET
+    name          = EXCLUDED.name,
+    email         = EXCLUDED.email,
+    phone         = EXCLUDED.phone,
+    address       = EXCLUDED.address,
+    date_of_birth = EXCLUDED.date_of_birth,
+    updated_at    = NOW()
+RETURNING {_PERSONAL_COLS}
+"""
+
+_SQL_INSERT_FINANCIAL = f"""
+INSERT INTO users_financial (user_id, account_number, credit_score, annual_income, total_debt)
+VALUES ($1, $2, $3, $4, $5)
+RETURNING {_FINANCIAL_COLS}
+"""
+
+_SQL_GET_FINANCIAL = f"SELECT {_FINANCIAL_COLS} FROM users_financial WHERE user_id = $1"
+
+_SQL_UPDATE_FINANCIAL = f"""
+UPDATE users_financial
+SET
+    account_number = COALESCE($2, account_number),
+    credit_score   = COALESCE($3, credit_score),
+    annual_income  = COALESCE($4, annual_income),
+    total_debt     = COALESCE($5, total_debt),
+    updated_at     = NOW()
+WHERE user_id = $1
+RETURNING {_FINANCIAL_COLS}
+"""
+
+_SQL_DELETE_FINANCIAL = "DELETE FROM users_financial WHERE user_id = $1 RETURNING TRUE"
+
+_SQL_UPSERT_FINANCIAL = f"""
+INSERT INTO users_financial (user_id, account_number, credit_score, annual_income, total_debt)
+VALUES ($1, $2, $3, $4, $5)
+ON CONFLICT (user_id) DO UPDATE SET
+    account_number = EXCLUDED.account_number,
+    credit_score   = EXCLUDED.credit_score,
+    annual_income  = EXCLUDED.annual_income,
+    total_debt     = EXCLUDED.total_debt,
+    updated_at     = NOW()
+RETURNING {_FINANCIAL_COLS}
+"""
+
+_SQL_INSERT_HEALTH = f"""
+INSERT INTO users_health (user_id, blood_type, conditions, medications, allergies)
+VALUES ($1, $2, $3, $4, $5)
+RETURNING {_HEALTH_COLS}
+"""
+
+_SQL_GET_HEALTH = f"SELECT {_HEALTH_COLS} FROM users_health WHERE user_id = $1"
+
+_SQL_UPDATE_HEALTH = f"""
+UPDATE users_health
+SET
+    blood_type  = COALESCE($2, blood_type),
+    conditions  = COALESCE($3, conditions),
+    medications = COALESCE($4, medications),
+    allergies   = COALESCE($5, allergies),
+    updated_at  = NOW()
+WHERE user_id = $1
+RETURNING {_HEALTH_COLS}
+"""
+
+_SQL_DELETE_HEALTH = "DELETE FROM users_health WHERE user_id = $1 RETURNING TRUE"
+
+_SQL_UPSERT_HEALTH = f"""
+INSERT INTO users_health (user_id, blood_type, conditions, medications, allergies)
+VALUES ($1, $2, $3, $4, $5)
+ON CONFLICT (user_id) DO UPDATE SET
+    blood_type  = EXCLUDED.blood_type,
+    conditions  = EXCLUDED.conditions,
+    medications = EXCLUDED.medications,
+    allergies   = EXCLUDED.allergies,
+    updated_at  = NOW()
+RETURNING {_HEALTH_COLS}
+"""
+
+# All three domains in one round-trip; each column is the row as jsonb, or NULL
+_SQL_GET_USER_FULL = """
+SELECT
+    (SELECT to_jsonb(p) FROM users_personal p WHERE p.user_id = $1) AS personal,
+    (SELECT to_jsonb(f) FROM users_financial f WHERE f.user_id = $1) AS financial,
+    (SELECT to_jsonb(h) FROM users_health h WHERE h.user_id = $1) AS health
+"""
+
+# Every CRUD statement, prepared once per pooled connection by _init_connection
+_PREPARED_SQL = {
+    "insert_personal": _SQL_INSERT_PERSONAL,
+    "get_personal": _SQL_GET_PERSONAL,
+    "update_personal": _SQL_UPDATE_PERSONAL,
+    "delete_personal": _SQL_DELETE_PERSONAL,
+    "upsert_personal": _SQL_UPSERT_PERSONAL,
+    "insert_financial": _SQL_INSERT_FINANCIAL,
+    "get_financial": _SQL_GET_FINANCIAL,
+    "update_financial": _SQL_UPDATE_FINANCIAL,
+    "delete_financial": _SQL_DELETE_FINANCIAL,
+    "upsert_financial": _SQL_UPSERT_FINANCIAL,
+    "insert_health": _SQL_INSERT_HEALTH,
+    "get_health": _SQL_GET_HEALTH,
+    "update_health": _SQL_UPDATE_HEALTH,
+    "delete_health": _SQL_DELETE_HEALTH,
+    "upsert_health": _SQL_UPSERT_HEALTH,
+    "get_user_full": _SQL_GET_USER_FULL,
+}
+
+
+# ---------------------------------------------------------------------------
+# Pool lifecycle (called from main.py lifespan)
+# ---------------------------------------------------------------------------
+
+class _Record(asyncpg.Record):
+    """Row that also exposes its columns as attributes.
+
+    Response models use from_attributes, so rows are validated directly
+    instead of being copied into a dict first.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+class _Connection(asyncpg.Connection):
+    """Pooled connection carrying the statements prepared for it at init."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared: dict[str, PreparedStatement] = {}
+
+
+# jsonb in binary wire format is a version byte (1) followed by the JSON text,
+# which orjson reads and writes as bytes without a str round-trip.
+_JSONB_VERSION = b"\x01"
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    return _JSONB_VERSION + orjson.dumps(value)
+
+
+def _decode_jsonb(data: bytes) -> Any:
+    return orjson.loads(memoryview(data)[1:])
+
+
+async def _init_connection(conn: _Connection) -> None:
+    """Pool init hook: register codecs, then prepare statements once per connection."""
+    # Decode jsonb columns to Python objects (codecs must be set before preparing)
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema="pg_catalog",
+        format="binary",
+    )
+    for name, sql in _PREPARED_SQL.items():
+        conn.prepared[name] = await conn.prepare(sql)
+
+
+async def _ensure_fillfactor(conn: asyncpg.Connection) -> None:
+    """Set _FILLFACTOR on the user tables that do not have it yet.
+
+    The ALTER runs under a short lock_timeout so startup never queues behind a
+    running (auto)vacuum. Fillfactor is only an optimisation: if the lock is
+    not granted, or the role does not own the table, startup continues and the
+    ALTER is retried on the next start.
+    """
+    rows = await conn.fetch(_SQL_TABLES_WITHOUT_FILLFACTOR, _FILLFACTOR_TABLES)
+    for row in rows:
+        table = row["relname"]
+        try:
+            async with conn.transaction():
+                await conn.execute(f"SET LOCAL lock_timeout = '{_FILLFACTOR_LOCK_TIMEOUT}'")
+                await conn.execute(f"ALTER TABLE {table} SET (fillfactor = {_FILLFACTOR})")
+        except asyncpg.LockNotAvailableError:
+            logger.warning("Table %s is locked; fillfactor not set, will retry on next start", table)
+        except asyncpg.InsufficientPrivilegeError:
+            logger.warning("Not the owner of table %s; fillfactor not set", table)
+        else:
+            logger.info("Set fillfactor=%d on %s", _FILLFACTOR, table)
+
 
 async def init_pool() -> None:
-    """Create the connection pool and ensure schema exists."""
+    """Ensure schema exists, then create the connection pool."""
     global _pool
-    _pool = await asyncpg.create_pool(settings.database_url, min_size=2, max_size=10)
-    async with _pool.acquire() as conn:
+    # The schema must exist before the pool's init hook prepares statements
+    conn = await asyncpg.connect(settings.database_url)
+    try:
         await conn.execute(_DDL)
+        await _ensure_fillfactor(conn)
+    finally:
+        await conn.close()
+
+    # JIT is disabled because its startup cost dwarfs the run time of these
+    # single-row OLTP queries. Idle connections above min_size are released
+    # after a minute so bursts do not pin server backends. The statement
+    # cache only serves the ad-hoc queries; CRUD statements are prepared
+    # explicitly in _init_connection.
+    _pool = await asyncpg.create_pool(
+        settings.database_url,
+        min_size=settings.db_pool_min,
+        max_size=settings.db_pool_max,
+        max_inactive_connection_lifetime=60,
+        statement_cache_size=256,
+        command_timeout=30,
+        server_settings={"application_name": "aws-s3-service", "jit": "off"},
+        connection_class=_Connection,
+        record_class=_Record,
+        init=_init_connection,
+    )
     logger.info("PostgreSQL connection pool created and schema initialised")
 
 
@@ -82,79 +356,170 @@ def _get_pool() -> asyncpg.Pool:
     return _pool
 
 
-def _row_to_dict(row: asyncpg.Record | None) -> dict[str, Any] | None:
-    """Convert an asyncpg Record to a plain dict."""
-    return dict(row) if row is not None else None
+async def _fetchrow(name: str, *args: Any) -> asyncpg.Record | None:
+    """Run a prepared statement by name and return its first row."""
+    async with _get_pool().acquire() as conn:
+        return await conn.prepared[name].fetchrow(*args)
+
+
+async def _fetchval(name: str, *args: Any) -> Any:
+    """Run a prepared statement by name and return the first column of its first row."""
+    async with _get_pool().acquire() as conn:
+        return await conn.prepared[name].fetchval(*args)
+
+
+# ---------------------------------------------------------------------------
+# Optional read-through cache for get_personal / get_financial / get_health,
+# enabled by DB_CACHE_TTL > 0.
+# Per process: writes made by this process update it immediately, writes made
+# elsewhere (other workers or replicas) become visible once the entry's TTL
+# expires. Only found rows are cached; lookups of missing rows always query
+# the database, so a row created elsewhere is never reported as missing.
+# ---------------------------------------------------------------------------
+
+_caches: dict[str, TTLCache] = (
+    {
+        domain: TTLCache(maxsize=settings.db_cache_size, ttl=settings.db_cache_ttl)
+        for domain in ("personal", "financial", "health")
+    }
+    if settings.db_cache_ttl > 0
+    else {}
+)
+
+# One lock per (domain, user_id) while in use; dropped once nobody holds it
+_cache_locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+
+def _cache_lock(domain: str, user_id: str) -> asyncio.Lock:
+    """Lock serialising loads and writes of one cache entry.
+
+    Concurrent misses for the same user wait for a single query instead of
+    stampeding the database, and a load cannot re-cache a row that a
+    concurrent write has just replaced.
+    """
+    key = (domain, user_id)
+    lock = _cache_locks.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _cache_locks[key] = lock
+    return lock
+
+
+def _cache_store(domain: str, user_id: str, row: asyncpg.Record | None) -> None:
+    """Cache a row this process just wrote, or drop the entry if there is none."""
+    cache = _caches.get(domain)
+    if cache is None:
+        return
+    if row is None:
+        cache.pop(user_id, None)
+    else:
+        cache[user_id] = row
+
+
+async def _cached_get(domain: str, user_id: str) -> asyncpg.Record | None:
+    """Return get_<domain> for user_id from the cache, loading it on a miss."""
+    cache = _caches.get(domain)
+    if cache is None:
+        return await _fetchrow(f"get_{domain}", user_id)
+    row = cache.get(user_id)
+    if row is not None:
+        return row
+    async with _cache_lock(domain, user_id):
+        row = cache.get(user_id)
+        if row is None:
+            row = await _fetchrow(f"get_{domain}", user_id)
+            _cache_store(domain, user_id, row)
+    return row
+
+
+async def _copy_rows(table: str, columns: list[str], records: list[tuple]) -> int:
+    """Bulk-insert records with one COPY and return the number of rows written.
+
+    COPY is atomic: a duplicate user_id fails the whole batch. The new rows
+    need no cache bookkeeping, since missing rows are never cached.
+    """
+    async with _get_pool().acquire() as conn:
+        status = await conn.copy_records_to_table(table, records=records, columns=columns)
+    return int(status.split()[-1])
 
 
 # ---------------------------------------------------------------------------
 # Personal information
 # ---------------------------------------------------------------------------
 
-async def insert_personal(data: dict[str, Any]) -> dict[str, Any]:
+async def insert_personal(data: PersonalInfoCreate) -> asyncpg.Record:
     """Insert a new personal-info row. Raises if user_id already exists."""
-    pool = _get_pool()
-    row = await pool.fetchrow(
-        """
-        INSERT INTO users_personal (user_id, name, email, phone, address, date_of_birth)
-        VALUES ($1, $2, $3, $4, $5, $6)
-        RETURNING *
-        """,
-        data["user_id"],
-        data["name"],
-        data["email"],
-        data.get("phone"),
-        data.get("address"),
-        data.get("date_of_birth"),
+    async with _cache_lock("personal", data.user_id):
+        row = await _fetchrow(
+            "insert_personal",
+            data.user_id,
+            data.name,
+            data.email,
+            data.phone,
+            data.address,
+            data.date_of_birth,
+        )
+        _cache_store("personal", data.user_id, row)
+    logger.info("Inserted personal info for user %s", data.user_id)
+    return row
+
+
+async def insert_personal_many(rows: list[PersonalInfoCreate]) -> int:
+    """Insert many personal-info rows in one COPY. Returns the number inserted."""
+    count = await _copy_rows(
+        "users_personal",
+        ["user_id", "name", "email", "phone", "address", "date_of_birth"],
+        [(r.user_id, r.name, r.email, r.phone, r.address, r.date_of_birth) for r in rows],
     )
-    logger.info("Inserted personal info for user %s", data["user_id"])
-    return _row_to_dict(row)
+    logger.info("Inserted personal info for %d users", count)
+    return count
 
 
-async def get_personal(user_id: str) -> dict[str, Any] | None:
+async def get_personal(user_id: str) -> asyncpg.Record | None:
     """Fetch personal info by user_id. Returns None if not found."""
-    pool = _get_pool()
-    row = await pool.fetchrow(
-        "SELECT * FROM users_personal WHERE user_id = $1", user_id
-    )
-    return _row_to_dict(row)
+    return await _cached_get("personal", user_id)
 
 
-async def update_personal(user_id: str, data: dict[str, Any]) -> dict[str, Any] | None:
+async def update_personal(user_id: str, data: PersonalInfoUpdate) -> asyncpg.Record | None:
     """Update personal info for a user. Only provided fields are changed."""
-    pool = _get_pool()
-    row = await pool.fetchrow(
-        """
-        UPDATE users_personal
-        SET
-            name          = COALESCE($2, name),
-            email         = COALESCE($3, email),
-            phone         = COALESCE($4, phone),
-            address       = COALESCE($5, address),
-            date_of_birth = COALESCE($6, date_of_birth),
-            updated_at    = NOW()
-        WHERE user_id = $1
-        RETURNING *
-        """,
-        user_id,
-        data.get("name"),
-        data.get("email"),
-        data.get("phone"),
-        data.get("address"),
-        data.get("date_of_birth"),
-    )
+    async with _cache_lock("personal", user_id):
+        row = await _fetchrow(
+            "update_personal",
+            user_id,
+            data.name,
+            data.email,
+            data.phone,
+            data.address,
+            data.date_of_birth,
+        )
+        _cache_store("personal", user_id, row)
     if row:
         logger.info("Updated personal info for user %s", user_id)
-    return _row_to_dict(row)
+    return row
+
+
+async def upsert_personal(user_id: str, data: PersonalInfoBase) -> asyncpg.Record:
+    """Insert or fully replace personal info for a user in one statement."""
+    async with _cache_lock("personal", user_id):
+        row = await _fetchrow(
+            "upsert_personal",
+            user_id,
+            data.name,
+            data.email,
+            data.phone,
+            data.address,
+            data.date_of_birth,
+        )
+        _cache_store("personal", user_id, row)
+    logger.info("Upserted personal info for user %s", user_id)
+    return row
 
 
 async def delete_personal(user_id: str) -> bool:
     """Delete personal info for a user. Returns True if a row was deleted."""
-    pool = _get_pool()
-    result = await pool.execute(
-        "DELETE FROM users_personal WHERE user_id = $1", user_id
-    )
-    deleted = result.split()[-1] != "0"
+    async with _cache_lock("personal", user_id):
+        deleted = await _fetchval("delete_personal", user_id) is not None
+        _cache_store("personal", user_id, None)
     if deleted:
         logger.info("Deleted personal info for user %s", user_id)
     return deleted
@@ -164,67 +529,76 @@ async def delete_personal(user_id: str) -> bool:
 # Financial information
 # ---------------------------------------------------------------------------
 
-async def insert_financial(data: dict[str, Any]) -> dict[str, Any]:
+async def insert_financial(data: FinancialInfoCreate) -> asyncpg.Record:
     """Insert a new financial-info row."""
-    pool = _get_pool()
-    row = await pool.fetchrow(
-        """
-        INSERT INTO users_financial (user_id, account_number, credit_score, annual_income, total_debt)
-        VALUES ($1, $2, $3, $4, $5)
-        RETURNING *
-        """,
-        data["user_id"],
-        data.get("account_number"),
-        data.get("credit_score"),
-        data.get("annual_income"),
-        data.get("total_debt"),
+    async with _cache_lock("financial", data.user_id):
+        row = await _fetchrow(
+            "insert_financial",
+            data.user_id,
+            data.account_number,
+            data.credit_score,
+            data.annual_income,
+            data.total_debt,
+        )
+        _cache_store("financial", data.user_id, row)
+    logger.info("Inserted financial info for user %s", data.user_id)
+    return row
+
+
+async def insert_financial_many(rows: list[FinancialInfoCreate]) -> int:
+    """Insert many financial-info rows in one COPY."""
+    count = await _copy_rows(
+        "users_financial",
+        ["user_id", "account_number", "credit_score", "annual_income", "total_debt"],
+        [(r.user_id, r.account_number, r.credit_score, r.annual_income, r.total_debt) for r in rows],
     )
-    logger.info("Inserted financial info for user %s", data["user_id"])
-    return _row_to_dict(row)
+    logger.info("Inserted financial info for %d users", count)
+    return count
 
 
-async def get_financial(user_id: str) -> dict[str, Any] | None:
+async def get_financial(user_id: str) -> asyncpg.Record | None:
     """Fetch financial info by user_id."""
-    pool = _get_pool()
-    row = await pool.fetchrow(
-        "SELECT * FROM users_financial WHERE user_id = $1", user_id
-    )
-    return _row_to_dict(row)
+    return await _cached_get("financial", user_id)
 
 
-async def update_financial(user_id: str, data: dict[str, Any]) -> dict[str, Any] | None:
+async def update_financial(user_id: str, data: FinancialInfoUpdate) -> asyncpg.Record | None:
     """Update financial info for a user."""
-    pool = _get_pool()
-    row = await pool.fetchrow(
-        """
-        UPDATE users_financial
-        SET
-            account_number = COALESCE($2, account_number),
-            credit_score   = COALESCE($3, credit_score),
-            annual_income  = COALESCE($4, annual_income),
-            total_debt     = COALESCE($5, total_debt),
-            updated_at     = NOW()
-        WHERE user_id = $1
-        RETURNING *
-        """,
-        user_id,
-        data.get("account_number"),
-        data.get("credit_score"),
-        data.get("annual_income"),
-        data.get("total_debt"),
-    )
+    async with _cache_lock("financial", user_id):
+        row = await _fetchrow(
+            "update_financial",
+            user_id,
+            data.account_number,
+            data.credit_score,
+            data.annual_income,
+            data.total_debt,
+        )
+        _cache_store("financial", user_id, row)
     if row:
         logger.info("Updated financial info for user %s", user_id)
-    return _row_to_dict(row)
+    return row
+
+
+async def upsert_financial(user_id: str, data: FinancialInfoBase) -> asyncpg.Record:
+    """Insert or fully replace financial info for a user."""
+    async with _cache_lock("financial", user_id):
+        row = await _fetchrow(
+            "upsert_financial",
+            user_id,
+            data.account_number,
+            data.credit_score,
+            data.annual_income,
+            data.total_debt,
+        )
+        _cache_store("financial", user_id, row)
+    logger.info("Upserted financial info for user %s", user_id)
+    return row
 
 
 async def delete_financial(user_id: str) -> bool:
     """Delete financial info for a user."""
-    pool = _get_pool()
-    result = await pool.execute(
-        "DELETE FROM users_financial WHERE user_id = $1", user_id
-    )
-    deleted = result.split()[-1] != "0"
+    async with _cache_lock("financial", user_id):
+        deleted = await _fetchval("delete_financial", user_id) is not None
+        _cache_store("financial", user_id, None)
     if deleted:
         logger.info("Deleted financial info for user %s", user_id)
     return deleted
@@ -234,67 +608,76 @@ async def delete_financial(user_id: str) -> bool:
 # Health information
 # ---------------------------------------------------------------------------
 
-async def insert_health(data: dict[str, Any]) -> dict[str, Any]:
+async def insert_health(data: HealthInfoCreate) -> asyncpg.Record:
     """Insert a new health-info row."""
-    pool = _get_pool()
-    row = await pool.fetchrow(
-        """
-        INSERT INTO users_health (user_id, blood_type, conditions, medications, allergies)
-        VALUES ($1, $2, $3, $4, $5)
-        RETURNING *
-        """,
-        data["user_id"],
-        data.get("blood_type"),
-        data.get("conditions", []),
-        data.get("medications", []),
-        data.get("allergies", []),
+    async with _cache_lock("health", data.user_id):
+        row = await _fetchrow(
+            "insert_health",
+            data.user_id,
+            data.blood_type,
+            data.conditions,
+            data.medications,
+            data.allergies,
+        )
+        _cache_store("health", data.user_id, row)
+    logger.info("Inserted health info for user %s", data.user_id)
+    return row
+
+
+async def insert_health_many(rows: list[HealthInfoCreate]) -> int:
+    """Insert many health-info rows in one COPY."""
+    count = await _copy_rows(
+        "users_health",
+        ["user_id", "blood_type", "conditions", "medications", "allergies"],
+        [(r.user_id, r.blood_type, r.conditions, r.medications, r.allergies) for r in rows],
     )
-    logger.info("Inserted health info for user %s", data["user_id"])
-    return _row_to_dict(row)
+    logger.info("Inserted health info for %d users", count)
+    return count
 
 
-async def get_health(user_id: str) -> dict[str, Any] | None:
+async def get_health(user_id: str) -> asyncpg.Record | None:
     """Fetch health info by user_id."""
-    pool = _get_pool()
-    row = await pool.fetchrow(
-        "SELECT * FROM users_health WHERE user_id = $1", user_id
-    )
-    return _row_to_dict(row)
+    return await _cached_get("health", user_id)
 
 
-async def update_health(user_id: str, data: dict[str, Any]) -> dict[str, Any] | None:
+async def update_health(user_id: str, data: HealthInfoUpdate) -> asyncpg.Record | None:
     """Update health info for a user."""
-    pool = _get_pool()
-    row = await pool.fetchrow(
-        """
-        UPDATE users_health
-        SET
-            blood_type  = COALESCE($2, blood_type),
-            conditions  = COALESCE($3, conditions),
-            medications = COALESCE($4, medications),
-            allergies   = COALESCE($5, allergies),
-            updated_at  = NOW()
-        WHERE user_id = $1
-        RETURNING *
-        """,
-        user_id,
-        data.get("blood_type"),
-        data.get("conditions"),
-        data.get("medications"),
-        data.get("allergies"),
-    )
+    async with _cache_lock("health", user_id):
+        row = await _fetchrow(
+            "update_health",
+            user_id,
+            data.blood_type,
+            data.conditions,
+            data.medications,
+            data.allergies,
+        )
+        _cache_store("health", user_id, row)
     if row:
         logger.info("Updated health info for user %s", user_id)
-    return _row_to_dict(row)
+    return row
+
+
+async def upsert_health(user_id: str, data: HealthInfoBase) -> asyncpg.Record:
+    """Insert or fully replace health info for a user."""
+    async with _cache_lock("health", user_id):
+        row = await _fetchrow(
+            "upsert_health",
+            user_id,
+            data.blood_type,
+            data.conditions,
+            data.medications,
+            data.allergies,
+        )
+        _cache_store("health", user_id, row)
+    logger.info("Upserted health info for user %s", user_id)
+    return row
 
 
 async def delete_health(user_id: str) -> bool:
     """Delete health info for a user."""
-    pool = _get_pool()
-    result = await pool.execute(
-        "DELETE FROM users_health WHERE user_id = $1", user_id
-    )
-    deleted = result.split()[-1] != "0"
+    async with _cache_lock("health", user_id):
+        deleted = await _fetchval("delete_health", user_id) is not None
+        _cache_store("health", user_id, None)
     if deleted:
         logger.info("Deleted health info for user %s", user_id)
     return deleted
@@ -305,15 +688,110 @@ async def delete_health(user_id: str) -> bool:
 # ---------------------------------------------------------------------------
 
 async def get_user_full(user_id: str) -> dict[str, Any]:
-    """Fetch personal, financial, and health records for a user in parallel."""
-    personal, financial, health = await asyncio.gather(
-        get_personal(user_id),
-        get_financial(user_id),
-        get_health(user_id),
-    )
+    """Fetch personal, financial, and health records for a user in one query."""
+    row = await _fetchrow("get_user_full", user_id)
     return {
         "user_id": user_id,
-        "personal": personal,
-        "financial": financial,
-        "health": health,
+        "personal": row["personal"],
+        "financial": row["financial"],
+        "health": row["health"],
     }
+
+
+# SQS message bodies built entirely in PostgreSQL. Each statement returns the
+# serialised JSON text (dates/timestamps already ISO-formatted, NUMERIC as JSON
+# numbers), or no row when the requested records do not exist.
+_USER_JSON_SQL = {
+    "personal": """
+        SELECT jsonb_build_object(
+            'user_id', p.user_id, 'data_type', 'personal', 'data', to_jsonb(p)
+        )::text
+        FROM users_personal p
+        WHERE p.user_id = $1
+    """,
+    "financial": """
+        SELECT jsonb_build_object(
+            'user_id', f.user_id, 'data_type', 'financial', 'data', to_jsonb(f)
+        )::text
+        FROM users_financial f
+        WHERE f.user_id = $1
+    """,
+    "health": """
+        SELECT jsonb_build_object(
+            'user_id', h.user_id, 'data_type', 'health', 'data', to_jsonb(h)
+        )::text
+        FROM users_health h
+        WHERE h.user_id = $1
+    """,
+    "all": """
+        SELECT jsonb_build_object(
+            'user_id', $1::text,
+            'data_type', 'all',
+            'data', jsonb_build_object(
+                'user_id', $1::text,
+                'personal', t.personal,
+                'financial', t.financial,
+                'health', t.health
+            )
+        )::text
+        FROM (
+            SELECT
+                (SELECT to_jsonb(p) FROM users_personal p WHERE p.user_id = $1) AS personal,
+                (SELECT to_jsonb(f) FROM users_financial f WHERE f.user_id = $1) AS financial,
+                (SELECT to_jsonb(h) FROM users_health h WHERE h.user_id = $1) AS health
+        ) AS t
+        WHERE num_nonnulls(t.personal, t.financial, t.health) > 0
+    """,
+}
+
+
+async def get_user_json(user_id: str, data_type: str) -> str | None:
+    """Build the SQS message body for a user in a single query.
+
+    data_type is one of "personal", "financial", "health" or "all". Returns the
+    JSON text of {"user_id", "data_type", "data"}, or None if no matching
+    records exist.
+    """
+    pool = _get_pool()
+    return await pool.fetchval(_USER_JSON_SQL[data_type], user_id)
+
+
+# Batch variant of _USER_JSON_SQL: one row per (user_id, data_type) pair, in
+# input order, with NULL where the requested records do not exist.
+_USERS_JSON_SQL = """
+SELECT
+    CASE WHEN d.data IS NOT NULL THEN
+        jsonb_build_object('user_id', r.user_id, 'data_type', r.data_type, 'data', d.data)::text
+    END
+FROM unnest($1::text[], $2::text[]) WITH ORDINALITY AS r(user_id, data_type, ord)
+LEFT JOIN users_personal p ON p.user_id = r.user_id
+LEFT JOIN users_financial f ON f.user_id = r.user_id
+LEFT JOIN users_health h ON h.user_id = r.user_id
+CROSS JOIN LATERAL (
+    SELECT CASE r.data_type
+        WHEN 'personal' THEN CASE WHEN p.user_id IS NOT NULL THEN to_jsonb(p) END
+        WHEN 'financial' THEN CASE WHEN f.user_id IS NOT NULL THEN to_jsonb(f) END
+        WHEN 'health' THEN CASE WHEN h.user_id IS NOT NULL THEN to_jsonb(h) END
+        WHEN 'all' THEN CASE WHEN num_nonnulls(p.user_id, f.user_id, h.user_id) > 0 THEN
+            jsonb_build_object(
+                'user_id', r.user_id,
+                'personal', CASE WHEN p.user_id IS NOT NULL THEN to_jsonb(p) END,
+                'financial', CASE WHEN f.user_id IS NOT NULL THEN to_jsonb(f) END,
+                'health', CASE WHEN h.user_id IS NOT NULL THEN to_jsonb(h) END
+            )
+        END
+    END AS data
+) AS d
+ORDER BY r.ord
+"""
+
+
+async def get_users_json(user_ids: list[str], data_types: list[str]) -> list[str | None]:
+    """Build SQS message bodies for many users in a single query.
+
+    user_ids and data_types are parallel lists. Returns one JSON text (or None
+    if the records do not exist) per input pair, in the same order.
+    """
+    pool = _get_pool()
+    rows = await pool.fetch(_USERS_JSON_SQL, user_ids, data_types)
+    return [row[0] for row in rows]
@@ -1,11 +1,14 @@
-import json
+import asyncio
+import gzip
 import logging
 from typing import Any
 
-import boto3
+import orjson
 from botocore.exceptions import ClientError
+from cachetools import LRUCache
 
 from app.config import settings
+from app.services.aws import AWSClient
 
 logger = logging.getLogger(__name__)
 
@@ -14,21 +17,65 @@ _PERSONAL_PREFIX = "users/personal"
 _FINANCIAL_PREFIX = "users/financial"
 _HEALTH_PREFIX = "users/health"
 
+# Conditional-write retries for update_json_file, and the S3 error codes that
+# mean another writer got there first
+_UPDATE_ATTEMPTS = 5
+_CONFLICT_CODES = {"PreconditionFailed", "ConditionalRequestConflict"}
+
+# Uploads at least this large are stored gzip-compressed (Content-Encoding:
+# gzip); level 1 already shrinks repetitive JSON several-fold at little CPU cost.
+_GZIP_MIN_BYTES = 1024
+_GZIP_LEVEL = 1
+
+# Parsed objects by key, as (etag, content, body size). Reads still go to S3,
+# but with If-None-Match: an unchanged object costs a bodiless 304 instead of a
+# download and a parse. botocore reports the 304 as a ClientError with one of
+# these codes. The cache is bounded by the total JSON body size of its entries,
+# and objects above _READ_CACHE_MAX_OBJECT_BYTES are never cached.
+_read_cache: LRUCache = LRUCache(maxsize=settings.s3_cache_bytes, getsizeof=lambda entry: entry[2])
+_READ_CACHE_MAX_OBJECT_BYTES = 1024 * 1024
+_NOT_MODIFIED_CODES = {"304", "NotModified"}
+
+# Shared client, opened by init_client() at startup
+_client = AWSClient("s3")
+
+# ---------------------------------------------------------------------------
+# Client lifecycle (called from main.py lifespan)
+# ---------------------------------------------------------------------------
+
+
+async def init_client() -> None:
+    """Open the shared async S3 client."""
+    await _client.open()
+
+
+async def close_client() -> None:
+    """Close the shared async S3 client."""
+    await _client.close()
+
 
 def _get_s3_client():
-    kwargs = {"region_name": settings.aws_region}
-    if settings.aws_endpoint_url:
-        kwargs["endpoint_url"] = settings.aws_endpoint_url
-    return boto3.client("s3", **kwargs)
+    return _client.get()
+
+
+class UpdateConflictError(RuntimeError):
+    """Raised when a conditional update keeps losing to concurrent writers."""
+
 
+async def _read_json_object(key: str, **kwargs: Any) -> tuple[dict[str, Any], str, int]:
+    """Read a JSON file from S3, returning its contents, ETag and JSON size in bytes.
 
-def read_json_file(key: str) -> dict[str, Any]:
-    """Read a JSON file from S3 and return its contents as a dict."""
+    Extra keyword arguments are passed to get_object.
+    """
     client = _get_s3_client()
     try:
-        response = client.get_object(Bucket=settings.s3_bucket_name, Key=key)
-        body = response["Body"].read().decode("utf-8")
-        return json.loads(body)
+        response = await client.get_object(Bucket=settings.s3_bucket_name, Key=key, **kwargs)
+        # Buffer the whole object in one read; orjson parses the raw bytes
+        async with response["Body"] as stream:
+            body = await stream.read()
+        if response.get("ContentEncoding") == "gzip":
+            body = gzip.decompress(body)
+        return orjson.loads(body), response["ETag"], len(body)
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
         if error_code == "NoSuchKey":
@@ -36,24 +83,83 @@ def read_json_file(key: str) -> dict[str, Any]:
         raise
 
 
-def update_json_file(key: str, updates: dict[str, Any]) -> dict[str, Any]:
-    """Read a JSON file from S3, merge updates into it, and upload it back."""
-    existing = read_json_file(key)
-    existing.update(updates)
-    upload_json_file(key, existing)
-    return existing
-
-
-def upload_json_file(key: str, content: dict[str, Any]) -> None:
-    """Upload a JSON dict to S3 as a file."""
+async def read_json_file(key: str) -> dict[str, Any]:
+    """Read a JSON file from S3 and return its contents as a dict.
+
+    The result may be served from _read_cache after S3 confirms the ETag is
+    unchanged; it is shared between callers and must not be modified.
+    """
+    cached = _read_cache.get(key)
+    if cached is None:
+        content, etag, size = await _read_json_object(key)
+    else:
+        etag, content, _ = cached
+        try:
+            content, etag, size = await _read_json_object(key, IfNoneMatch=etag)
+        except ClientError as e:
+            if e.response["Error"]["Code"] not in _NOT_MODIFIED_CODES:
+                raise
+            return content
+    if size <= min(_READ_CACHE_MAX_OBJECT_BYTES, _read_cache.maxsize):
+        _read_cache[key] = (etag, content, size)
+    else:
+        _read_cache.pop(key, None)
+    return content
+
+
+async def update_json_file(key: str, updates: dict[str, Any]) -> dict[str, Any]:
+    """Read a JSON file from S3, merge updates into it, and upload it back.
+
+    The write is conditional on the ETag that was read (If-Match), so a
+    concurrent writer cannot be silently overwritten; on conflict the merge is
+    redone against the fresh object, up to _UPDATE_ATTEMPTS times.
+    """
+    for _ in range(_UPDATE_ATTEMPTS):
+        existing, etag, _ = await _read_json_object(key)
+        existing.update(updates)
+        try:
+            await upload_json_file(key, existing, if_match=etag)
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            if error_code in _CONFLICT_CODES:
+                logger.info("Concurrent update of s3://%s/%s, retrying", settings.s3_bucket_name, key)
+                continue
+            if error_code == "NoSuchKey":
+                raise FileNotFoundError(f"S3 key not found: {key}") from e
+            raise
+        return existing
+    raise UpdateConflictError(f"S3 key {key} kept changing during update")
+
+
+async def upload_json_file(
+    key: str,
+    content: dict[str, Any],
+    *,
+    if_match: str | None = None,
+    pretty: bool = False,
+) -> None:
+    """Upload a JSON dict to S3 as a file.
+
+    The JSON is compact unless pretty is set, and gzip-compressed once it
+    reaches _GZIP_MIN_BYTES. If if_match is given the PUT only succeeds while
+    the stored object still has that ETag.
+    """
     client = _get_s3_client()
-    body = json.dumps(content, indent=2)
-    client.put_object(
+    body = orjson.dumps(content, option=orjson.OPT_INDENT_2 if pretty else None)
+    kwargs: dict[str, Any] = {}
+    if len(body) >= _GZIP_MIN_BYTES:
+        body = gzip.compress(body, compresslevel=_GZIP_LEVEL)
+        kwargs["ContentEncoding"] = "gzip"
+    if if_match:
+        kwargs["IfMatch"] = if_match
+    await client.put_object(
         Bucket=settings.s3_bucket_name,
         Key=key,
-        Body=body.encode("utf-8"),
+        Body=body,
         ContentType="application/json",
+        **kwargs,
     )
+    _read_cache.pop(key, None)
     logger.info("Uploaded JSON file to s3://%s/%s", settings.s3_bucket_name, key)
 
 
@@ -65,32 +171,38 @@ def upload_json_file(key: str, content: dict[str, Any]) -> None:
 #   users/health/{user_id}.json
 # ---------------------------------------------------------------------------
 
-def read_personal_info(user_id: str) -> dict[str, Any]:
+async def read_personal_info(user_id: str) -> dict[str, Any]:
     """Read personal information for a user from S3."""
     key = f"{_PERSONAL_PREFIX}/{user_id}.json"
     logger.info("Reading personal info for user %s from S3", user_id)
-    return read_json_file(key)
+    return await read_json_file(key)
 
 
-def read_financial_info(user_id: str) -> dict[str, Any]:
+async def read_financial_info(user_id: str) -> dict[str, Any]:
     """Read financial information for a user from S3."""
     key = f"{_FINANCIAL_PREFIX}/{user_id}.json"
     logger.info("Reading financial info for user %s from S3", user_id)
-    return read_json_file(key)
+    return await read_json_file(key)
 
 
-def read_health_info(user_id: str) -> dict[str, Any]:
+async def read_health_info(user_id: str) -> dict[str, Any]:
     """Read health information for a user from S3."""
     key = f"{_HEALTH_PREFIX}/{user_id}.json"
     logger.info("Reading health info for user %s from S3", user_id)
-    return read_json_file(key)
+    return await read_json_file(key)
 
 
-def read_all_user_info(user_id: str) -> dict[str, Any]:
-    """Read and merge personal, financial, and health information for a user."""
-    personal = read_personal_info(user_id)
-    financial = read_financial_info(user_id)
-    health = read_health_info(user_id)
+async def read_all_user_info(user_id: str) -> dict[str, Any]:
+    """Read and merge personal, financial, and health information for a user.
+
+    The three objects are fetched concurrently; the first failure (e.g.
+    FileNotFoundError for a missing object) is raised as soon as it occurs.
+    """
+    personal, financial, health = await asyncio.gather(
+        read_personal_info(user_id),
+        read_financial_info(user_id),
+        read_health_info(user_id),
+    )
     return {
         "user_id": user_id,
         "personal": personal,
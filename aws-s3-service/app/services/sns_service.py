@@ -1,30 +1,201 @@
+import asyncio
 import logging
 
-import boto3
-
 from app.config import settings
+from app.services.aws import AWSClient
 
 logger = logging.getLogger(__name__)
 
+# PublishBatch accepts at most 10 entries totalling 256 KiB; publish_message
+# waits up to _COALESCE_WINDOW seconds for other publishes to share its call.
+_BATCH_SIZE = 10
+_BATCH_MAX_BYTES = 256 * 1024
+_COALESCE_WINDOW = 0.01
+
+# Shared client, opened by init_client() at startup
+_client = AWSClient("sns")
+
+# Pending (message, subject, future) entries and the task batching them;
+# _flushes holds the in-flight PublishBatch calls.
+_queue: asyncio.Queue | None = None
+_batcher: asyncio.Task | None = None
+_flushes: set[asyncio.Task] = set()
+
+
+async def init_client() -> None:
+    """Open the shared async SNS client."""
+    await _client.open()
+    _start_batcher()
+
+
+async def close_client() -> None:
+    """Close the shared async SNS client."""
+    await _stop_batcher()
+    await _client.close()
+
 
 def _get_sns_client():
-    kwargs = {"region_name": settings.aws_region}
-    if settings.aws_endpoint_url:
-        kwargs["endpoint_url"] = settings.aws_endpoint_url
-    return boto3.client("sns", **kwargs)
+    return _client.get()
+
 
+async def publish_messages(messages: list[tuple[str, str | None]]) -> list[str | None]:
+    """Publish up to 10 (message, subject) pairs, 256 KiB in total, in one PublishBatch call.
 
-def publish_message(message: str, subject: str | None = None) -> str:
-    """Publish a message to the configured SNS topic. Returns the MessageId."""
+    Returns the MessageId of each message in input order, or None for entries
+    that SNS rejected.
+    """
     client = _get_sns_client()
-    kwargs = {
-        "TopicArn": settings.sns_topic_arn,
-        "Message": message,
-    }
+    entries = []
+    for i, (message, subject) in enumerate(messages):
+        entry = {"Id": str(i), "Message": message}
+        if subject:
+            entry["Subject"] = subject
+        entries.append(entry)
+
+    response = await client.publish_batch(
+        TopicArn=settings.sns_topic_arn,
+        PublishBatchRequestEntries=entries,
+    )
+    message_ids: list[str | None] = [None] * len(messages)
+    for success in response.get("Successful", []):
+        message_ids[int(success["Id"])] = success["MessageId"]
+    for failure in response.get("Failed", []):
+        logger.warning("SNS rejected batch entry %s: %s", failure["Id"], failure.get("Message"))
+    logger.info("Published %d SNS messages to %s", len(response.get("Successful", [])), settings.sns_topic_arn)
+    return message_ids
+
+
+async def publish_message(message: str, subject: str | None = None) -> str:
+    """Publish a message to the configured SNS topic. Returns the MessageId.
+
+    Concurrent calls are coalesced into shared PublishBatch calls.
+    """
+    if _queue is None:
+        raise RuntimeError("SNS client is not initialised")
+    future = asyncio.get_running_loop().create_future()
+    await _queue.put((message, subject, future))
+    return await future
+
+
+async def _publish_one(message: str, subject: str | None) -> str:
+    """Publish a single message with a plain Publish call."""
+    client = _get_sns_client()
+    kwargs = {"TopicArn": settings.sns_topic_arn, "Message": message}
     if subject:
         kwargs["Subject"] = subject
+    response = await client.publish(**kwargs)
+    return response["MessageId"]
+
+
+# ---------------------------------------------------------------------------
+# Publish coalescing: publish_message enqueues, the batcher sends PublishBatch
+# calls of up to _BATCH_SIZE entries / _BATCH_MAX_BYTES gathered within
+# _COALESCE_WINDOW.
+# ---------------------------------------------------------------------------
+
+_Entry = tuple[str, str | None, asyncio.Future]
+
+
+def _start_batcher() -> None:
+    global _queue, _batcher
+    _queue = asyncio.Queue()
+    _batcher = asyncio.create_task(_run_batcher(_queue))
+
+
+async def _stop_batcher() -> None:
+    """Stop batching, publish what the batcher holds and fail anything still queued."""
+    global _queue, _batcher
+    if _batcher is None:
+        return
+    _batcher.cancel()
+    try:
+        await _batcher
+    except asyncio.CancelledError:
+        pass
+    await asyncio.gather(*_flushes, return_exceptions=True)
+    while not _queue.empty():
+        _, _, future = _queue.get_nowait()
+        if not future.done():
+            future.set_exception(RuntimeError("SNS client is closed"))
+    _queue = None
+    _batcher = None
+
+
+def _entry_size(entry: _Entry) -> int:
+    message, subject, _ = entry
+    return len(message.encode()) + (len(subject.encode()) if subject else 0)
+
+
+def _start_flush(batch: list[_Entry]) -> None:
+    """Publish a batch in the background so the next one can fill meanwhile."""
+    task = asyncio.create_task(_flush(batch))
+    _flushes.add(task)
+    task.add_done_callback(_flushes.discard)
+
+
+async def _run_batcher(queue: asyncio.Queue) -> None:
+    loop = asyncio.get_running_loop()
+    batch: list[_Entry] = []
+    # Entry that would have pushed the previous batch over _BATCH_MAX_BYTES
+    carry: _Entry | None = None
+    try:
+        while True:
+            if carry is None:
+                carry = await queue.get()
+            batch, size, carry = [carry], _entry_size(carry), None
+            deadline = loop.time() + _COALESCE_WINDOW
+            while len(batch) < _BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(queue.get(), timeout)
+                except TimeoutError:
+                    break
+                entry_size = _entry_size(entry)
+                if size + entry_size > _BATCH_MAX_BYTES:
+                    carry = entry
+                    break
+                batch.append(entry)
+                size += entry_size
+            _start_flush(batch)
+            batch = []
+    except asyncio.CancelledError:
+        # Entries already taken off the queue are still published
+        if batch:
+            _start_flush(batch)
+        if carry is not None:
+            _start_flush([carry])
+        raise
+
+
+async def _flush(batch: list[_Entry]) -> None:
+    """Publish one coalesced batch and resolve each caller's future.
+
+    If the PublishBatch call itself fails, each entry is retried with its own
+    Publish call so one caller's problem does not fail the others.
+    """
+    messages = [(message, subject) for message, subject, _ in batch]
+    try:
+        message_ids = await publish_messages(messages)
+    except Exception as exc:  # noqa: BLE001 - handed to the waiting callers below
+        if len(batch) == 1:
+            _resolve(batch[0][2], exc)
+            return
+        logger.warning("SNS PublishBatch of %d messages failed, publishing them one by one: %s", len(batch), exc)
+        results = await asyncio.gather(*(_publish_one(m, s) for m, s in messages), return_exceptions=True)
+        for (_, _, future), result in zip(batch, results):
+            _resolve(future, result)
+        return
+    for (_, _, future), message_id in zip(batch, message_ids):
+        _resolve(future, message_id if message_id is not None else RuntimeError("SNS rejected the message"))
+
 
-    response = client.publish(**kwargs)
-    message_id = response["MessageId"]
-    logger.info("Published SNS message %s to %s", message_id, settings.sns_topic_arn)
-    return message_id
+def _resolve(future: asyncio.Future, result: str | BaseException) -> None:
+    """Complete a caller's future unless it was cancelled in the meantime."""
+    if future.done():
+        return
+    if isinstance(result, BaseException):
+        future.set_exception(result)
+    else:
+        future.set_result(result)
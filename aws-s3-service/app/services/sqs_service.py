@@ -1,28 +1,52 @@
 import asyncio
-import json
 import logging
 from typing import Any
 
-import boto3
+import orjson
+from pydantic import TypeAdapter, ValidationError
 
 from app.config import settings
+from app.schemas.models import SQSUserMessage
+from app.services.aws import AWSClient
 
 logger = logging.getLogger(__name__)
 
+# Built once at import; validate_json parses bytes/str straight into the model
+_MESSAGE_ADAPTER = TypeAdapter(SQSUserMessage)
+
+
+# Receives kept in flight and received batches buffered ahead of processing,
+# so the next long-poll overlaps with the current batch. Messages are received
+# with an explicit visibility timeout that covers that buffering plus
+# processing, so slow batches are not redelivered mid-flight.
+_RECEIVERS = 2
+_PREFETCH_BATCHES = 2
+_VISIBILITY_TIMEOUT = 120
+
+# Shared client, opened by init_client() at startup
+_client = AWSClient("sqs")
+
+
+async def init_client() -> None:
+    """Open the shared async SQS client."""
+    await _client.open()
+
+
+async def close_client() -> None:
+    """Close the shared async SQS client."""
+    await _client.close()
+
 
 def _get_sqs_client():
-    kwargs = {"region_name": settings.aws_region}
-    if settings.aws_endpoint_url:
-        kwargs["endpoint_url"] = settings.aws_endpoint_url
-    return boto3.client("sqs", **kwargs)
+    return _client.get()
 
 
 # ---------------------------------------------------------------------------
 # Producer: send a message to SQS
 # ---------------------------------------------------------------------------
 
-def send_message(
-    payload: dict[str, Any],
+async def send_message(
+    payload: dict[str, Any] | str,
     *,
     message_group_id: str | None = None,
     message_deduplication_id: str | None = None,
@@ -30,7 +54,9 @@ def send_message(
     """Send a JSON payload to the configured SQS queue.
 
     Args:
-        payload: Dict that will be JSON-serialised as the message body.
+        payload: Dict that will be JSON-serialised as the message body (date,
+            datetime and UUID values are encoded natively), or an
+            already-serialised JSON string that is sent as-is.
         message_group_id: Required for FIFO queues; ignored for standard queues.
         message_deduplication_id: Required for FIFO queues without content-based
             deduplication; ignored for standard queues.
@@ -39,7 +65,7 @@ def send_message(
         The SQS MessageId of the sent message.
     """
     client = _get_sqs_client()
-    body = json.dumps(payload)
+    body = payload if isinstance(payload, str) else orjson.dumps(payload).decode()
     kwargs: dict[str, Any] = {
         "QueueUrl": settings.sqs_queue_url,
         "MessageBody": body,
@@ -49,45 +75,149 @@ def send_message(
     if message_deduplication_id:
         kwargs["MessageDeduplicationId"] = message_deduplication_id
 
-    response = client.send_message(**kwargs)
+    response = await client.send_message(**kwargs)
     message_id: str = response["MessageId"]
     logger.info("Sent SQS message %s to %s", message_id, settings.sqs_queue_url)
     return message_id
 
 
+async def send_message_batch(messages: list[dict[str, Any]]) -> list[str | None]:
+    """Send up to 10 messages to the configured queue in one SendMessageBatch call.
+
+    Args:
+        messages: Dicts with a "body" (JSON string) and optional
+            "message_group_id" / "message_deduplication_id" keys, with the same
+            meaning as the send_message arguments.
+
+    Returns:
+        The SQS MessageId of each message in input order, or None for entries
+        that SQS rejected.
+    """
+    client = _get_sqs_client()
+    entries = []
+    for i, message in enumerate(messages):
+        entry: dict[str, Any] = {"Id": str(i), "MessageBody": message["body"]}
+        if message.get("message_group_id"):
+            entry["MessageGroupId"] = message["message_group_id"]
+        if message.get("message_deduplication_id"):
+            entry["MessageDeduplicationId"] = message["message_deduplication_id"]
+        entries.append(entry)
+
+    response = await client.send_message_batch(QueueUrl=settings.sqs_queue_url, Entries=entries)
+    message_ids: list[str | None] = [None] * len(messages)
+    for success in response.get("Successful", []):
+        message_ids[int(success["Id"])] = success["MessageId"]
+    for failure in response.get("Failed", []):
+        logger.warning("SQS rejected batch entry %s: %s", failure["Id"], failure.get("Message"))
+    logger.info("Sent %d SQS messages to %s", len(response.get("Successful", [])), settings.sqs_queue_url)
+    return message_ids
+
+
 def _process_message(message: dict) -> None:
     """Process a single SQS message. Customize this with your business logic."""
     body = message.get("Body", "")
     try:
-        parsed = json.loads(body)
-        logger.info("Processed SQS message: %s", parsed)
-    except json.JSONDecodeError:
-        logger.info("Processed SQS message (raw): %s", body)
+        parsed = _MESSAGE_ADAPTER.validate_json(body)
+        logger.debug("Processed SQS message: %s", parsed)
+    except ValidationError:
+        logger.debug("Processed SQS message (raw): %s", body)
 
 
-async def poll_sqs(stop_event: asyncio.Event) -> None:
-    """Long-poll SQS in a loop until stop_event is set."""
-    client = _get_sqs_client()
-    logger.info("SQS consumer started, polling %s", settings.sqs_queue_url)
+async def _handle_message(message: dict) -> None:
+    """Process one received message in a worker thread.
+
+    _process_message is synchronous business logic, so it runs off the event
+    loop. Batches are processed one at a time, so at most 10 run concurrently.
+    """
+    await asyncio.to_thread(_process_message, message)
+
 
+async def _delete_messages(client, messages: list[dict]) -> None:
+    """Delete up to 10 processed messages with a single DeleteMessageBatch call.
+
+    Entries SQS fails to delete are logged and left on the queue; they become
+    visible again after the visibility timeout and are redelivered.
+    """
+    entries = [
+        {"Id": str(i), "ReceiptHandle": message["ReceiptHandle"]}
+        for i, message in enumerate(messages)
+    ]
+    response = await client.delete_message_batch(
+        QueueUrl=settings.sqs_queue_url,
+        Entries=entries,
+    )
+    for failure in response.get("Failed", []):
+        logger.warning(
+            "Failed to delete SQS message %s (%s): %s",
+            messages[int(failure["Id"])]["MessageId"],
+            failure.get("Code"),
+            failure.get("Message"),
+        )
+
+
+async def _receive_loop(client, batches: asyncio.Queue, stop_event: asyncio.Event) -> None:
+    """Long-poll SQS and hand each non-empty batch to poll_sqs via batches."""
     while not stop_event.is_set():
         try:
-            response = await asyncio.to_thread(
-                client.receive_message,
+            response = await client.receive_message(
                 QueueUrl=settings.sqs_queue_url,
                 MaxNumberOfMessages=10,
                 WaitTimeSeconds=20,
+                VisibilityTimeout=_VISIBILITY_TIMEOUT,
             )
-            messages = response.get("Messages", [])
-            for msg in messages:
-                _process_message(msg)
-                await asyncio.to_thread(
-                    client.delete_message,
-                    QueueUrl=settings.sqs_queue_url,
-                    ReceiptHandle=msg["ReceiptHandle"],
-                )
         except Exception:
             logger.exception("Error polling SQS")
             await asyncio.sleep(5)
+            continue
+        messages = response.get("Messages", [])
+        if messages:
+            await batches.put(messages)
+
+
+async def _process_batch(client, messages: list[dict]) -> None:
+    """Process a received batch concurrently, then delete what succeeded."""
+    results = await asyncio.gather(
+        *(_handle_message(msg) for msg in messages),
+        return_exceptions=True,
+    )
+    # Only processed messages are deleted; failures are redelivered
+    processed = []
+    for msg, result in zip(messages, results):
+        if isinstance(result, Exception):
+            logger.error("Failed to process SQS message %s", msg["MessageId"], exc_info=result)
+        else:
+            processed.append(msg)
+    if processed:
+        await _delete_messages(client, processed)
+    logger.info("Processed %d of %d SQS messages", len(processed), len(messages))
 
-    logger.info("SQS consumer stopped")
+
+async def poll_sqs(stop_event: asyncio.Event) -> None:
+    """Consume the queue until stop_event is set or the task is cancelled.
+
+    _RECEIVERS long-polls (up to 20s, 10 messages each) run in the background
+    and buffer up to _PREFETCH_BATCHES batches, so receiving overlaps with
+    processing. Each batch's messages are handled concurrently and then deleted
+    with one DeleteMessageBatch call. Batches still buffered at shutdown are
+    redelivered once their visibility timeout expires.
+    """
+    client = _get_sqs_client()
+    batches: asyncio.Queue = asyncio.Queue(maxsize=_PREFETCH_BATCHES)
+    receivers = [
+        asyncio.create_task(_receive_loop(client, batches, stop_event))
+        for _ in range(_RECEIVERS)
+    ]
+    logger.info("SQS consumer started, polling %s", settings.sqs_queue_url)
+
+    try:
+        while not stop_event.is_set():
+            messages = await batches.get()
+            try:
+                await _process_batch(client, messages)
+            except Exception:
+                logger.exception("Error processing SQS batch")
+    finally:
+        for task in receivers:
+            task.cancel()
+        await asyncio.gather(*receivers, return_exceptions=True)
+        logger.info("SQS consumer stopped")
@@ -0,0 +1,40 @@
+"""Standalone SQS consumer process.
+
+Runs poll_sqs on its own event loop and SQS client, so the web tier can be
+scaled to several uvicorn workers with RUN_SQS_POLLER=false without each one
+starting a competing consumer:
+
+    python -m app.workers.sqs
+"""
+
+import asyncio
+import signal
+
+from app.log import configure_logging
+from app.services import sqs_service
+
+configure_logging()
+
+
+async def main() -> None:
+    await sqs_service.init_client()
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    sqs_task = asyncio.create_task(sqs_service.poll_sqs(stop_event))
+    await stop_event.wait()
+
+    # A receive may be mid long-poll; cancel rather than wait up to 20s
+    sqs_task.cancel()
+    try:
+        await sqs_task
+    except asyncio.CancelledError:
+        pass
+    await sqs_service.close_client()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
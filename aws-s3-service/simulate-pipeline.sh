@@ -336,7 +336,7 @@ output " ---> 3d5f7a9c1e2b"
 output "Step 6/7 : EXPOSE 8000"
 output " ---> Running in 1a2b3c4d5e6f"
 output " ---> 6b8d0f2a4c6e"
-output "Step 7/7 : CMD [\"uvicorn\", \"app.main:app\", \"--host\", \"0.0.0.0\", \"--port\", \"8000\"]"
+output "Step 7/7 : CMD [\"uvicorn\", \"app.main:app\", \"--host\", \"0.0.0.0\", \"--port\", \"8000\", \"--loop\", \"uvloop\", \"--http\", \"httptools\"]"
 output " ---> Running in 7e8f9a0b1c2d"
 output " ---> 9c1e3f5a7b2d"
 output "Successfully built 9c1e3f5a7b2d"
@@ -0,0 +1,14 @@
+import pytest
+from pydantic import ValidationError
+
+from app.config import Settings
+
+
+def test_pool_defaults_do_not_depend_on_the_host():
+    settings = Settings()
+    assert (settings.db_pool_min, settings.db_pool_max) == (5, 10)
+
+
+def test_pool_min_above_max_is_rejected():
+    with pytest.raises(ValidationError, match="db_pool_min"):
+        Settings(db_pool_max=4)
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+from cachetools import TTLCache
+
+from app.services import db_service
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    """Replace _fetchrow with a fake table and record every query."""
+    rows = {"u1": {"user_id": "u1"}}
+    calls: list[tuple[str, str]] = []
+
+    async def fetchrow(name, user_id, *args):
+        calls.append((name, user_id))
+        return rows.get(user_id)
+
+    monkeypatch.setattr(db_service, "_fetchrow", fetchrow)
+    return calls
+
+
+@pytest.fixture
+def cache_enabled(monkeypatch):
+    caches = {domain: TTLCache(maxsize=100, ttl=60) for domain in ("personal", "financial", "health")}
+    monkeypatch.setattr(db_service, "_caches", caches)
+    return caches
+
+
+def test_disabled_cache_always_queries(fetches, monkeypatch):
+    monkeypatch.setattr(db_service, "_caches", {})
+
+    async def main():
+        await db_service.get_personal("u1")
+        await db_service.get_personal("u1")
+
+    asyncio.run(main())
+    assert fetches == [("get_personal", "u1"), ("get_personal", "u1")]
+
+
+def test_found_rows_are_cached(fetches, cache_enabled):
+    async def main():
+        return [await db_service.get_personal("u1") for _ in range(3)]
+
+    assert asyncio.run(main()) == [{"user_id": "u1"}] * 3
+    assert fetches == [("get_personal", "u1")]
+
+
+def test_misses_are_not_cached(fetches, cache_enabled):
+    async def main():
+        assert await db_service.get_personal("missing") is None
+        assert await db_service.get_personal("missing") is None
+
+    asyncio.run(main())
+    assert fetches == [("get_personal", "missing"), ("get_personal", "missing")]
+    assert "missing" not in cache_enabled["personal"]
+
+
+def test_delete_drops_the_cached_row(fetches, cache_enabled, monkeypatch):
+    async def fetchval(name, user_id):
+        return True
+
+    monkeypatch.setattr(db_service, "_fetchval", fetchval)
+
+    async def main():
+        await db_service.get_personal("u1")
+        assert await db_service.delete_personal("u1") is True
+
+    asyncio.run(main())
+    assert "u1" not in cache_enabled["personal"]
+
@@ -0,0 +1,51 @@
+import asyncio
+import contextlib
+
+import asyncpg
+
+from app.services import db_service
+
+
+class FakeConnection:
+    def __init__(self, missing, locked=(), not_owned=()):
+        self.missing = missing
+        self.locked = set(locked)
+        self.not_owned = set(not_owned)
+        self.executed: list[str] = []
+
+    async def fetch(self, sql, tables):
+        return [{"relname": table} for table in tables if table in self.missing]
+
+    @contextlib.asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def execute(self, sql):
+        if sql.startswith("ALTER TABLE") and sql.split()[2] in self.locked:
+            raise asyncpg.LockNotAvailableError("lock timeout")
+        if sql.startswith("ALTER TABLE") and sql.split()[2] in self.not_owned:
+            raise asyncpg.InsufficientPrivilegeError("must be owner of table")
+        self.executed.append(sql)
+
+
+def test_fillfactor_is_left_alone_when_already_set():
+    conn = FakeConnection(missing=[])
+    asyncio.run(db_service._ensure_fillfactor(conn))
+    assert conn.executed == []
+
+
+def test_fillfactor_is_set_only_where_missing_and_skips_locked_tables():
+    conn = FakeConnection(missing=["users_personal", "users_health"], locked=["users_health"])
+    asyncio.run(db_service._ensure_fillfactor(conn))
+    alters = [sql for sql in conn.executed if sql.startswith("ALTER")]
+    assert alters == ["ALTER TABLE users_personal SET (fillfactor = 90)"]
+    assert "SET LOCAL lock_timeout = '2s'" in conn.executed
+
+
+def test_fillfactor_skips_tables_the_role_does_not_own():
+    conn = FakeConnection(
+        missing=["users_personal", "users_health"], not_owned=["users_personal"]
+    )
+    asyncio.run(db_service._ensure_fillfactor(conn))
+    alters = [sql for sql in conn.executed if sql.startswith("ALTER")]
+    assert alters == ["ALTER TABLE users_health SET (fillfactor = 90)"]
@@ -0,0 +1,85 @@
+import asyncio
+
+import orjson
+import pytest
+from botocore.exceptions import ClientError
+from cachetools import LRUCache
+
+from app.services import s3_service
+
+
+class FakeBody:
+    def __init__(self, data):
+        self.data = data
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def read(self):
+        return self.data
+
+
+class FakeS3Client:
+    """Serves objects by key and answers If-None-Match like S3."""
+
+    def __init__(self, objects):
+        self.objects = objects  # key -> (etag, content)
+        self.downloads: list[str] = []
+
+    async def get_object(self, Bucket, Key, IfNoneMatch=None):
+        etag, content = self.objects[Key]
+        if IfNoneMatch == etag:
+            raise ClientError({"Error": {"Code": "304", "Message": "Not Modified"}}, "GetObject")
+        self.downloads.append(Key)
+        return {"ETag": etag, "Body": FakeBody(orjson.dumps(content))}
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    def install(objects, cache_bytes=10_000):
+        client = FakeS3Client(objects)
+        monkeypatch.setattr(s3_service._client, "_client", client)
+        cache = LRUCache(maxsize=cache_bytes, getsizeof=lambda entry: entry[2])
+        monkeypatch.setattr(s3_service, "_read_cache", cache)
+        return client
+    return install
+
+
+def read_all(*keys):
+    async def main():
+        return [await s3_service.read_json_file(key) for key in keys]
+    return asyncio.run(main())
+
+
+def test_unchanged_object_is_served_from_cache(s3):
+    client = s3({"a": ('"e1"', {"v": 1})})
+    assert read_all("a", "a", "a") == [{"v": 1}] * 3
+    assert client.downloads == ["a"]
+
+
+def test_changed_object_is_downloaded_again(s3):
+    client = s3({"a": ('"e1"', {"v": 1})})
+    read_all("a")
+    client.objects["a"] = ('"e2"', {"v": 2})
+    assert read_all("a") == [{"v": 2}]
+    assert client.downloads == ["a", "a"]
+
+
+def test_objects_over_the_size_limit_are_not_cached(s3, monkeypatch):
+    monkeypatch.setattr(s3_service, "_READ_CACHE_MAX_OBJECT_BYTES", 50)
+    client = s3({"big": ('"e1"', {"v": "x" * 100})})
+    read_all("big", "big")
+    assert client.downloads == ["big", "big"]
+    assert "big" not in s3_service._read_cache
+
+
+def test_cache_is_bounded_by_total_body_size(s3):
+    objects = {key: ('"e"', {"v": "x" * 40}) for key in "abc"}
+    client = s3(objects, cache_bytes=110)
+    read_all("a", "b", "c", "a")
+    # Each body is ~50 bytes, so only two fit and "a" was evicted by "c"
+    assert client.downloads == ["a", "b", "c", "a"]
+    assert sum(entry[2] for entry in s3_service._read_cache.values()) <= 110
@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+
+from app.services import sns_service
+
+
+class FakeSNSClient:
+    """Records PublishBatch/Publish calls and fails like SNS would."""
+
+    def __init__(self, reject=(), fail_batches=False):
+        self.batches: list[list[str]] = []
+        self.singles: list[str] = []
+        self.reject = set(reject)
+        self.fail_batches = fail_batches
+
+    async def publish_batch(self, TopicArn, PublishBatchRequestEntries):
+        messages = [entry["Message"] for entry in PublishBatchRequestEntries]
+        self.batches.append(messages)
+        await asyncio.sleep(0)
+        if self.fail_batches:
+            raise RuntimeError("PublishBatch failed")
+        if sum(len(m.encode()) for m in messages) > sns_service._BATCH_MAX_BYTES:
+            raise RuntimeError("BatchRequestTooLong")
+        return {
+            "Successful": [
+                {"Id": e["Id"], "MessageId": f"id-{e['Message'][:8]}"}
+                for e in PublishBatchRequestEntries
+                if e["Message"] not in self.reject
+            ],
+            "Failed": [
+                {"Id": e["Id"], "Code": "InvalidParameter", "Message": "rejected"}
+                for e in PublishBatchRequestEntries
+                if e["Message"] in self.reject
+            ],
+        }
+
+    async def publish(self, TopicArn, Message, Subject=None):
+        self.singles.append(Message)
+        return {"MessageId": f"single-{Message[:8]}"}
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    def install(**kwargs):
+        client = FakeSNSClient(**kwargs)
+        monkeypatch.setattr(sns_service._client, "_client", client)
+        return client
+    return install
+
+
+def run_with_batcher(coro_fn):
+    """Run coro_fn() with the batcher started, stopping it afterwards."""
+    async def main():
+        sns_service._start_batcher()
+        try:
+            return await coro_fn()
+        finally:
+            await sns_service._stop_batcher()
+    return asyncio.run(main())
+
+
+def test_concurrent_publishes_are_coalesced(fake_client):
+    client = fake_client()
+
+    async def publish_all():
+        return await asyncio.gather(*(sns_service.publish_message(f"m{i:02d}") for i in range(23)))
+
+    message_ids = run_with_batcher(publish_all)
+
+    assert message_ids == [f"id-m{i:02d}" for i in range(23)]
+    assert [len(batch) for batch in client.batches] == [10, 10, 3]
+
+
+def test_rejected_entry_fails_only_its_caller(fake_client):
+    fake_client(reject={"bad"})
+
+    async def publish_all():
+        return await asyncio.gather(
+            sns_service.publish_message("good"),
+            sns_service.publish_message("bad"),
+            return_exceptions=True,
+        )
+
+    good, bad = run_with_batcher(publish_all)
+
+    assert good == "id-good"
+    assert isinstance(bad, RuntimeError)
+
+
+def test_batches_are_capped_by_total_size(fake_client):
+    client = fake_client()
+    big = "x" * 200_000
+
+    async def publish_all():
+        return await asyncio.gather(
+            sns_service.publish_message(big + "1"),
+            sns_service.publish_message(big + "2"),
+        )
+
+    message_ids = run_with_batcher(publish_all)
+
+    assert message_ids == ["id-xxxxxxxx", "id-xxxxxxxx"]
+    assert [len(batch) for batch in client.batches] == [1, 1]
+
+
+def test_failed_batch_is_retried_per_entry(fake_client):
+    client = fake_client(fail_batches=True)
+
+    async def publish_all():
+        return await asyncio.gather(sns_service.publish_message("a"), sns_service.publish_message("b"))
+
+    assert run_with_batcher(publish_all) == ["single-a", "single-b"]
+    assert client.batches == [["a", "b"]]
+    assert sorted(client.singles) == ["a", "b"]
+
+
+def test_stop_publishes_entries_held_by_the_batcher(fake_client):
+    client = fake_client()
+
+    async def main():
+        sns_service._start_batcher()
+        task = asyncio.create_task(sns_service.publish_message("last"))
+        # Let the batcher take the entry and enter its coalescing window
+        for _ in range(3):
+            await asyncio.sleep(0)
+        await sns_service._stop_batcher()
+        assert task.done()
+        return task.result()
+
+    assert asyncio.run(main()) == "id-last"
+    assert client.batches == [["last"]]
+
+
+def test_publish_after_stop_is_rejected(fake_client):
+    fake_client()
+
+    async def main():
+        sns_service._start_batcher()
+        await sns_service._stop_batcher()
+        await sns_service.publish_message("late")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(main())
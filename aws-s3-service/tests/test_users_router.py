@@ -0,0 +1,59 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers import users
+from app.schemas.models import SQSSendRequest
+from app.services import db_service, sqs_service
+
+
+def test_send_batch_reports_failed_chunk_and_keeps_sent(monkeypatch):
+    requests = [SQSSendRequest(user_id=f"u{i:02d}", data_type="personal") for i in range(12)]
+
+    async def get_users_json(user_ids, data_types):
+        return [f'{{"user_id": "{user_id}"}}' for user_id in user_ids]
+
+    async def send_message_batch(messages):
+        if len(messages) == 2:
+            raise RuntimeError("throttled")
+        return [f"mid-{i}" for i in range(len(messages))]
+
+    monkeypatch.setattr(db_service, "get_users_json", get_users_json)
+    monkeypatch.setattr(sqs_service, "send_message_batch", send_message_batch)
+
+    response = asyncio.run(users.send_users_data_to_sqs(requests))
+
+    assert [s.user_id for s in response.sent] == [f"u{i:02d}" for i in range(10)]
+    assert [f.user_id for f in response.failed] == ["u10", "u11"]
+    assert all("throttled" in f.detail for f in response.failed)
+
+
+def test_send_batch_closes_chunks_at_the_size_limit(monkeypatch):
+    requests = [SQSSendRequest(user_id=f"u{i}", data_type="personal") for i in range(4)]
+    big = "x" * (100 * 1024)
+
+    async def get_users_json(user_ids, data_types):
+        return [f'{{"user_id": "{user_id}", "blob": "{big}"}}' for user_id in user_ids]
+
+    calls = []
+
+    async def send_message_batch(messages):
+        calls.append(len(messages))
+        assert sum(len(m["body"].encode()) for m in messages) <= users._SQS_BATCH_MAX_BYTES
+        return [f"mid-{i}" for i in range(len(messages))]
+
+    monkeypatch.setattr(db_service, "get_users_json", get_users_json)
+    monkeypatch.setattr(sqs_service, "send_message_batch", send_message_batch)
+
+    response = asyncio.run(users.send_users_data_to_sqs(requests))
+
+    assert calls == [2, 2]
+    assert [s.user_id for s in response.sent] == ["u0", "u1", "u2", "u3"]
+
+
+def test_send_batch_rejects_oversized_request_lists():
+    client = TestClient(app)
+    body = [{"user_id": f"u{i}", "data_type": "personal"} for i in range(users._SQS_MAX_BATCH_REQUESTS + 1)]
+    response = client.post("/users/sqs/send_batch", json=body)
+    assert response.status_code == 422